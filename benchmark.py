@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+
+"""
+    Measure the startup time of war-alert and fail when it regresses.
+
+    Usage: ./benchmark.py [--imports-only]
+
+    The measurement runs in a fresh interpreter, so that the import time is
+    not hidden by modules that are already loaded. The first cycle is run
+    without notifiers, without OpenAI queries and on a copy of the hash file,
+    so nothing is sent or paid for and the state of the running service is
+    left untouched. The feeds are still fetched over the network.
+"""
+
+import json
+import logging
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+def measure(cycle: bool) -> dict:
+    """
+        Measure the import and the first cycle time in this interpreter.
+    """
+    logger = logging.getLogger(__name__)
+    logger.addHandler(logging.NullHandler())
+
+    # Import and build all the enabled components
+    # The same imports as war-alert.py, the environment is already loaded
+    start = time.perf_counter()
+    import dotenv
+    import canary
+    import components
+    import pipeline
+    import profiling
+    for source in components.all_sources(logger):
+        source.processors()
+    components.all_notifiers(logger)
+    result = {"import": time.perf_counter() - start}
+
+    # Run the first cycle without notifiers and OpenAI queries
+    if cycle:
+        from processors.base import Processor
+
+        class ProcessorOffline(Processor):
+            """
+                A processor accepting every content instead of OpenAI.
+            """
+            def process(self, content, logger):
+                """
+                    Return the content unchanged.
+                """
+                return content
+
+        components.overrides["processor.openai"] = ProcessorOffline
+        start = time.perf_counter()
+        pipeline.run_cycle(logger, notifiers=[])
+        result["cycle"] = time.perf_counter() - start
+
+    return result
+
+def run(cycle: bool) -> dict:
+    """
+        Measure the startup time in a fresh interpreter.
+    """
+    import processors.unique
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        # Work on a copy of the hash file
+        hash_file = processors.unique.tmp_file_name()
+        if os.path.exists(hash_file):
+            shutil.copy(hash_file, tmpdir)
+
+        command = [sys.executable, os.path.abspath(__file__), "--measure"]
+        if not cycle:
+            command.append("--imports-only")
+        output = subprocess.run(command, check=True, stdout=subprocess.PIPE,
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+            env={
+                **os.environ,
+                "TMPDIR": tmpdir,
+                "HEALTH_FILE": tmpdir + "/war-alert-health.json",
+                "CANARY_FILE": tmpdir + "/war-alert-canary.jsonl",
+                "PROFILE_DIR": tmpdir + "/war-alert-profile",
+            }).stdout
+        return json.loads(output)
+
+if __name__ == "__main__":
+    cycle = "--imports-only" not in sys.argv
+
+    # Measure in the child, which inherits the environment of the parent
+    if "--measure" in sys.argv:
+        print(json.dumps(measure(cycle)))
+        sys.exit(0)
+
+    # Load the .env file
+    import dotenv
+    dotenv.load_dotenv()
+
+    # Compare the measurements with the limits
+    result = run(cycle)
+    limits = {
+        "import": float(os.environ.get("BENCHMARK_IMPORT_LIMIT", 1.0)),
+        "cycle": float(os.environ.get("BENCHMARK_CYCLE_LIMIT", 60.0)),
+    }
+    regressions = [name for name in result if result[name] > limits[name]]
+
+    print(json.dumps({
+        "time": time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime()),
+        "result": result,
+        "limits": limits,
+        "regressions": regressions,
+    }))
+    sys.exit(1 if regressions else 0)
@@ -0,0 +1,141 @@
+import json
+import logging
+import os
+import time
+import uuid
+import components
+import pipeline
+from processors.base import Content, Processor
+from processors.unique import search_hash_in_file
+
+def canary_file_name() -> str:
+    """
+        Return the file of the latency series using $CANARY_FILE or $TMPDIR
+        environment variables.
+    """
+    return os.environ.get("CANARY_FILE",
+        os.environ.get("TMPDIR", "/tmp") + "/war-alert-canary.jsonl")
+
+def canary_notifiers(logger: logging.Logger) -> list:
+    """
+        Return the notifiers used as the test sink, listed in $CANARY_NOTIFIERS
+        by their name (telegram, pushover, email). Without them the canary is
+        dropped before the notifiers.
+    """
+    names = os.environ.get("CANARY_NOTIFIERS", "").split()
+    return [notifier for notifier in components.all_notifiers(logger) \
+        if type(notifier).__name__.lower().removeprefix("notifier") in names]
+
+class ProcessorCanaryUnique(Processor):
+    """
+        A class to represent the unique processor of the canary. It searches
+        the hash file like ProcessorUnique but never writes to it.
+    """
+    def process(self, content: Content, logger: logging.Logger) -> Content|None:
+        """
+            Process a content.
+        """
+        if search_hash_in_file(content.digest):
+            return None
+        return content
+
+class Canary:
+    """
+        A class to inject synthetic items into the pipeline and measure the
+        end-to-end latency.
+    """
+    def __init__(self):
+        """
+            Initialize a canary.
+        """
+        self.pending = False
+        self.last = time.monotonic()
+
+    def enqueue(self) -> None:
+        """
+            Request a canary. Safe to call from a signal handler.
+        """
+        self.pending = True
+
+    def due(self) -> bool:
+        """
+            Check if a canary was requested or the interval has elapsed.
+        """
+        interval = int(os.environ.get("CANARY_INTERVAL", 0))
+        return self.pending \
+            or (interval > 0 and time.monotonic() - self.last >= interval)
+
+    def run(self, logger: logging.Logger) -> None:
+        """
+            Pass a synthetic item through the pipeline and record its latency.
+        """
+        self.pending = False
+        self.last = time.monotonic()
+
+        # Build the pipeline of the enabled sources: OpenAI is queried only
+        # for the RSS sources
+        if components.enabled("source.rss"):
+            item = components.module("source.rss").News
+            processors = [ProcessorCanaryUnique,
+                *components.processors("openai")]
+        elif components.enabled("source.alertsua"):
+            item = components.module("source.alertsua").Alert
+            processors = [ProcessorCanaryUnique]
+        else:
+            logger.warning(json.dumps({
+                "time": time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime()),
+                "msg": "Canary skipped, no source is enabled",
+            }, ensure_ascii=False))
+            return
+
+        # Prepare the synthetic item, tagged by its guid
+        now = time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime())
+        content = item(
+            "Everything is fine, it's just a test.",
+            "We are testing the system. Please do not panic. Test time: " + now,
+            now,
+            "https://github.com/piotr-ku/war-alert",
+            f"canary-{uuid.uuid4()}")
+
+        # Process the item and time the stages
+        stages = {}
+        start = time.perf_counter()
+        result = pipeline.process(content, processors,
+            canary_notifiers(logger), logger, stages)
+        latency = time.perf_counter() - start
+
+        record = {
+            "time": now,
+            "latency": latency,
+            "stages": stages,
+            "passed": result is not None,
+        }
+        self.export(record, logger)
+
+        # Alarm if the item was dropped or the latency exceeds the threshold
+        threshold = float(os.environ.get("CANARY_THRESHOLD", 60))
+        if result is None or latency > threshold:
+            logger.error(json.dumps({
+                **record,
+                "msg": "Canary failed",
+                "threshold": threshold,
+            }, ensure_ascii=False))
+        else:
+            logger.info(json.dumps({**record, "msg": "Canary passed"},
+                ensure_ascii=False))
+
+    def export(self, record: dict, logger: logging.Logger) -> None:
+        """
+            Append a record to the latency series.
+        """
+        try:
+            with open(canary_file_name(), "a") as file:
+                file.write(json.dumps(record, ensure_ascii=False) + "\n")
+        except Exception as e:
+            logger.error(json.dumps({
+                "time": time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime()),
+                "msg": "Error writing canary latency",
+                "exception": str(e),
+            }, ensure_ascii=False))
+
+canary = Canary()
@@ -0,0 +1,96 @@
+import importlib
+import logging
+import os
+
+# Registry of all components: name -> (module, class, required env variables).
+# Modules are imported only when a component is loaded, so a deployment that
+# does not use e.g. RSS never pays for importing the OpenAI client.
+COMPONENTS = {
+    "source.alertsua": ("sources.alertsua", "SourceAlertsInUa",
+        ["ALERTSUA_TOKEN"]),
+    "source.rss": ("sources.rss", "SourceRSS", ["RSS_URLS"]),
+    "processor.unique": ("processors.unique", "ProcessorUnique", []),
+    "processor.cluster": ("processors.cluster", "ProcessorCluster", []),
+    "processor.openai": ("processors.openai", "ProcessorOpenAI", []),
+    "processor.cluster_add": ("processors.cluster", "ProcessorClusterAdd", []),
+    "notifier.telegram": ("notifiers.telegram", "NotifierTelegram",
+        ["TELEGRAM_BOT_TOKEN"]),
+    "notifier.pushover": ("notifiers.pushover", "NotifierPushover",
+        ["PUSHOVER_TOKEN"]),
+    "notifier.email": ("notifiers.email", "NotifierEmail",
+        ["EMAIL_FROM", "EMAIL_TO"]),
+}
+
+# Classes replacing components at runtime, e.g. stubs used by the benchmark
+overrides = {}
+
+def is_set(name: str) -> bool:
+    """
+        Check if an environment variable is set and not empty.
+    """
+    return os.environ.get(name) is not None and os.environ.get(name) != ""
+
+def enabled(name: str) -> bool:
+    """
+        Check if a component is enabled by its environment configuration.
+    """
+    return all(is_set(variable) for variable in COMPONENTS[name][2])
+
+def module(name: str):
+    """
+        Import and return the module of a component.
+    """
+    return importlib.import_module(COMPONENTS[name][0])
+
+def load(name: str) -> type:
+    """
+        Import and return the class of a component.
+    """
+    if name in overrides:
+        return overrides[name]
+    return getattr(module(name), COMPONENTS[name][1])
+
+def processors(*names: str) -> list[type]:
+    """
+        Return a list of processor classes.
+    """
+    return [load(f"processor.{name}") for name in names]
+
+def all_sources(logger: logging.Logger) -> list:
+    """
+        Return a list of all enabled sources.
+    """
+    all_sources = []
+
+    # Add the AlertsInUa source if the token is set
+    if enabled("source.alertsua"):
+        alertsua = module("source.alertsua")
+        all_sources.append(alertsua.SourceAlertsInUa(alertsua.url, logger))
+
+    # Add the RSS sources if the URLs are set
+    if enabled("source.rss"):
+        for url in os.environ.get("RSS_URLS").split():
+            all_sources.append(load("source.rss")(url, logger))
+
+    return all_sources
+
+def all_notifiers(logger: logging.Logger) -> list:
+    """
+        Return a list of all enabled notifiers.
+    """
+    all_notifiers = []
+
+    # Add the Telegram notifier if the token is set
+    if enabled("notifier.telegram"):
+        all_notifiers.append(load("notifier.telegram")())
+
+    # Add the Pushover notifier if the token is set
+    if enabled("notifier.pushover"):
+        all_notifiers.append(load("notifier.pushover")())
+
+    # Add the Email notifier if the sender and recipients are set
+    if enabled("notifier.email"):
+        for email in os.environ.get("EMAIL_TO").split():
+            all_notifiers.append(load("notifier.email")(email))
+
+    return all_notifiers
@@ -0,0 +1,125 @@
+import json
+import logging
+import os
+import time
+
+def health_file_name() -> str:
+    """
+        Return the file of the status dump using $HEALTH_FILE or $TMPDIR
+        environment variables.
+    """
+    return os.environ.get("HEALTH_FILE",
+        os.environ.get("TMPDIR", "/tmp") + "/war-alert-health.json")
+
+class SourceHealth:
+    """
+        A class to represent the health of a source.
+    """
+    __slots__ = ("failures", "latency", "last_success", "last_failure",
+        "next_probe", "error")
+
+    def __init__(self):
+        """
+            Initialize the health of a source.
+        """
+        self.failures = 0
+        self.latency = None
+        self.last_success = None
+        self.last_failure = None
+        self.next_probe = 0.0
+        self.error = None
+
+    def state(self) -> str:
+        """
+            Return the state of the source: ok, failing, open (skipped until
+            the next probe) or probing.
+        """
+        if self.failures == 0:
+            return "ok"
+        if self.next_probe == 0.0:
+            return "failing"
+        if time.time() < self.next_probe:
+            return "open"
+        return "probing"
+
+    def available(self) -> bool:
+        """
+            Check if the source should be polled.
+        """
+        return time.time() >= self.next_probe
+
+    def record(self, latency: float, error: str|None,
+        critical: bool = False) -> None:
+        """
+            Record the result of a fetch. A critical source is polled every
+            cycle, so it never backs off.
+        """
+        # Update the latency EWMA
+        alpha = float(os.environ.get("HEALTH_EWMA_ALPHA", 0.3))
+        if self.latency is None:
+            self.latency = latency
+        else:
+            self.latency = alpha * latency + (1 - alpha) * self.latency
+
+        # Reset the state on success
+        if error is None:
+            self.failures = 0
+            self.last_success = time.time()
+            self.next_probe = 0.0
+            self.error = None
+            return
+
+        # Back off exponentially after the threshold of failures
+        self.failures += 1
+        self.last_failure = time.time()
+        self.error = error
+        threshold = int(os.environ.get("HEALTH_FAILURE_THRESHOLD", 3))
+        if self.failures >= threshold and not critical:
+            backoff = min(
+                float(os.environ.get("HEALTH_BACKOFF_MAX", 3600)),
+                float(os.environ.get("HEALTH_BACKOFF_BASE", 600)) \
+                    * 2 ** (self.failures - threshold))
+            self.next_probe = self.last_failure + backoff
+
+    def status(self) -> dict:
+        """
+            Return the health as a dictionary.
+        """
+        return {
+            "state": self.state(),
+            "failures": self.failures,
+            "latency": self.latency,
+            "last_success": self.last_success,
+            "last_failure": self.last_failure,
+            "next_probe": self.next_probe or None,
+            "error": self.error,
+        }
+
+# The health of the sources by their URL
+sources = {}
+
+def get(url: str) -> SourceHealth:
+    """
+        Return the health of a source, create it if it doesn't exist.
+    """
+    if url not in sources:
+        sources[url] = SourceHealth()
+    return sources[url]
+
+def dump(logger: logging.Logger) -> None:
+    """
+        Write the health of all the sources to the status file.
+    """
+    try:
+        with open(health_file_name(), "w") as file:
+            json.dump({
+                "time": time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime()),
+                "sources": {url: state.status() \
+                    for url, state in sources.items()},
+            }, file, ensure_ascii=False, indent=2)
+    except Exception as e:
+        logger.error(json.dumps({
+            "time": time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime()),
+            "msg": "Error writing health status",
+            "exception": str(e),
+        }, ensure_ascii=False))
@@ -31,7 +31,7 @@ class NotifierEmail(Notifier):
         msg['Subject'] = content.title
         msg['From'] = self.sender
         msg['To'] = self.recipient
-        msg.set_content(f"{content.description}\n\n{content.link}")
+        msg.set_content(f"{content.message}\n\n{content.link}")
 
         # SMTP configuration
         smtp_server = os.environ.get("SMTP_SERVER", "smtp.example.com")
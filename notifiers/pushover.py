@@ -26,7 +26,7 @@ class NotifierPushover(Notifier):
                 "token": os.environ.get("PUSHOVER_TOKEN"),
                 "user": os.environ.get("PUSHOVER_USER"),
                 "title": content.title,
-                "message": f"{content.description}\n\n{content.link}",
+                "message": f"{content.message}\n\n{content.link}",
                 "priority": 1,
             })
         except Exception as e:
@@ -23,7 +23,7 @@ class NotifierTelegram(Notifier):
         url = f"{self.api_url}{os.environ.get('TELEGRAM_BOT_TOKEN')}/sendMessage"
         payload = {
             "chat_id": os.environ.get("TELEGRAM_CHANNEL_ID"),
-            "text": f"{content.title}\n\n{content.description}\n\n{content.link}",
+            "text": f"{content.title}\n\n{content.message}\n\n{content.link}",
         }
 
         # Send a POST request
@@ -0,0 +1,97 @@
+import json
+import logging
+import os
+import time
+import components
+import health
+import profiling
+from processors.base import Content, Processor
+
+def process(item: Content, processors: list[Processor], notifiers: list,
+    logger: logging.Logger, timings: dict|None = None) -> Content|None:
+    """
+        Pass an item through the processors and notify the result. The
+        duration of each stage is stored in timings if given.
+    """
+    if timings is None:
+        timings = {}
+
+    # Loop through the processors
+    for processor in processors:
+        if item is None:
+            return None
+        start = time.perf_counter()
+        with profiling.span(processor.__name__, stage="process",
+            item=item.digest):
+            item = processor().process(item, logger)
+        timings[processor.__name__] = time.perf_counter() - start
+
+    # Loop through the notifiers
+    if item is not None:
+        for notifier in notifiers:
+            start = time.perf_counter()
+            with profiling.span(type(notifier).__name__, stage="notify",
+                item=item.digest):
+                notifier.notify(item, logger)
+            timings[type(notifier).__name__] = time.perf_counter() - start
+    return item
+
+def is_critical(source) -> bool:
+    """
+        Check if a source is critical by its class or by $CRITICAL_SOURCES.
+    """
+    return source.critical \
+        or source.url in os.environ.get("CRITICAL_SOURCES", "").split()
+
+def run_cycle(logger: logging.Logger, notifiers: list|None = None) -> None:
+    """
+        Fetch all the sources once and process their items. Critical sources
+        are polled first and always; the others are skipped while backing off
+        or when the cycle deadline is exceeded.
+    """
+    if notifiers is None:
+        notifiers = components.all_notifiers(logger)
+    deadline = time.monotonic() + float(os.environ.get("CYCLE_DEADLINE", 300))
+    timeout = float(os.environ.get("SOURCE_TIMEOUT", 10))
+
+    # Loop through the sources, the critical ones first
+    for source in sorted(components.all_sources(logger),
+        key=lambda source: not is_critical(source)):
+        state = health.get(source.url)
+        remaining = deadline - time.monotonic()
+
+        # Skip the failing or late sources unless they are critical
+        if not is_critical(source) \
+            and (not state.available() or remaining <= 0):
+            logger.info(json.dumps({
+                "time": time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime()),
+                "msg": "Source skipped",
+                "url": source.url,
+                "reason": "deadline" if state.available() else "backoff",
+            }, ensure_ascii=False))
+            continue
+
+        # Fetch the items and record the health of the source
+        start = time.perf_counter()
+        try:
+            with profiling.span(type(source).__name__, stage="fetch",
+                source=source.url):
+                items = source.fetch(logger, timeout if is_critical(source) \
+                    else min(timeout, remaining))
+        except Exception as e:
+            logger.error(json.dumps({
+                "time": time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime()),
+                "url": source.url,
+                "msg": "Error fetching source",
+                "exception": str(e),
+            }, ensure_ascii=False))
+            source.error = str(e)
+            items = []
+        state.record(time.perf_counter() - start, source.error,
+            is_critical(source))
+
+        for item in items:
+            process(item, source.processors(), notifiers, logger)
+
+    # Write the status dump
+    health.dump(logger)
@@ -1,9 +1,83 @@
+import datetime
+import email.utils
+import hashlib
 from abc import ABC, abstractmethod
 
+def normalize(text: str|None) -> str:
+    """
+        Normalize a text: lowercase and collapse the whitespaces.
+    """
+    if text is None:
+        return ""
+    return " ".join(text.lower().split())
+
+def strip(text: str|None) -> str:
+    """
+        Strip and collapse the whitespaces of a case-sensitive text.
+    """
+    if text is None:
+        return ""
+    return " ".join(text.split())
+
+def parse_date(text: str|None) -> float|None:
+    """
+        Return a timestamp of an RFC 822 (RSS) or ISO 8601 (JSON) date.
+    """
+    if text is None:
+        return None
+    try:
+        return email.utils.parsedate_to_datetime(text).timestamp()
+    except (TypeError, ValueError):
+        pass
+    try:
+        return datetime.datetime.fromisoformat(
+            text.strip().replace("Z", "+00:00")).timestamp()
+    except ValueError:
+        return None
+
 class Content(ABC):
     """
         A base class for all contents.
     """
+    __slots__ = (
+        # Fields of the source item, never modified by the processors
+        "title", "description", "pubDate", "link", "guid",
+        # Derived once at construction
+        "digest", "published",
+        # Enrichment added by the processors
+        "justification", "signature",
+    )
+
+    def __init__(self, title, description, pubDate, link, guid=None):
+        """
+            Initialize a content.
+        """
+        self.title = title
+        self.description = description
+        self.pubDate = pubDate
+        self.link = link
+        self.guid = guid
+        self.published = parse_date(pubDate)
+        self.justification = None
+        self.signature = None
+
+        # The identity of the content, the first of the stable fields set,
+        # or the description if there is none. Guid and link are
+        # case-sensitive identifiers.
+        identity = strip(guid) or strip(link) or normalize(title) \
+            or normalize(description)
+        self.digest = hashlib.md5(identity.encode("utf-8")).hexdigest()
+
+    @property
+    def message(self) -> str:
+        """
+            Return the text to notify: the justification if set, otherwise
+            the description.
+        """
+        if self.justification is not None:
+            return self.justification
+        return self.description
+
     @abstractmethod
     def __str__(self) -> str:
         """
@@ -0,0 +1,230 @@
+import collections
+import hashlib
+import json
+import logging
+import os
+import random
+import re
+import time
+from processors.base import Processor
+from processors.base import Content, normalize
+
+# The MinHash signature is split into BANDS bands of ROWS rows each, so
+# stories with a similarity of 0.5 become candidates with a probability of
+# 0.99
+BANDS = 33
+ROWS = 3
+PRIME = (1 << 61) - 1
+
+# A fixed seed keeps the signatures in the cluster file comparable
+generator = random.Random(0)
+PERMUTATIONS = [(generator.randrange(1, PRIME), generator.randrange(PRIME)) \
+    for _ in range(BANDS * ROWS)]
+
+def cluster_file_name():
+    """
+        Return a cluster file name using $TMPDIR environment variable.
+    """
+    return os.environ.get("TMPDIR", "/tmp") + "/war-alert-cluster.txt"
+
+# English and Polish words carrying no meaning of a story
+STOPWORDS = set("""
+    a an and are as at be by for from has have in is it its of on or over
+    says said than that the this to was were will with after following
+    do i na o od po się w we z za ze że nie jak już
+""".split())
+
+# Length of the word prefixes: a crude stemmer matching the inflected forms
+# of a word, e.g. expels/expelled or granica/granicę
+PREFIX = 4
+
+def shingles(text: str) -> set[str]:
+    """
+        Return the set of the prefixes of the meaningful words of a
+        normalized text.
+    """
+    return {word[:PREFIX] for word in re.findall(r"\w+", normalize(text)) \
+        if word not in STOPWORDS}
+
+def minhash(text: str) -> list[int]|None:
+    """
+        Return the MinHash signature of a text, None if it has no words.
+    """
+    features = [int.from_bytes(
+        hashlib.md5(feature.encode("utf-8")).digest()[:8], "big") \
+        for feature in shingles(text)]
+    if not features:
+        return None
+    return [min((a * feature + b) % PRIME for feature in features) \
+        for a, b in PERMUTATIONS]
+
+def similarity(first: list[int], second: list[int]) -> float:
+    """
+        Return the estimated Jaccard similarity of two signatures.
+    """
+    return sum(x == y for x, y in zip(first, second)) / len(first)
+
+class Index:
+    """
+        A class to represent a time-windowed LSH index of MinHash signatures.
+        Only the entries sharing a band with a signature are compared to it.
+    """
+    def __init__(self, threshold: float, window: float):
+        """
+            Initialize an index.
+        """
+        self.threshold = threshold
+        self.window = window
+        self.buckets = collections.defaultdict(list)
+        self.entries = collections.deque()
+
+    def keys(self, signature: list[int]) -> list[tuple]:
+        """
+            Return the bucket keys of a signature.
+        """
+        return [(band, *signature[band * ROWS:(band + 1) * ROWS]) \
+            for band in range(BANDS)]
+
+    def expire(self, now: float) -> bool:
+        """
+            Remove the entries older than the window. Return True if any was
+            removed.
+        """
+        expired = bool(self.entries) \
+            and self.entries[0]["time"] < now - self.window
+        while self.entries and self.entries[0]["time"] < now - self.window:
+            entry = self.entries.popleft()
+            for key in self.keys(entry["signature"]):
+                self.buckets[key].remove(entry)
+                if not self.buckets[key]:
+                    del self.buckets[key]
+        return expired
+
+    def search(self, signature: list[int]) -> dict|None:
+        """
+            Return the most similar entry above the threshold.
+        """
+        best = None
+        for key in self.keys(signature):
+            for entry in self.buckets.get(key, []):
+                score = similarity(entry["signature"], signature)
+                if score >= self.threshold \
+                    and (best is None or score > best[0]):
+                    best = (score, entry)
+        return best[1] if best is not None else None
+
+    def add(self, signature: list[int], link: str, now: float) -> dict:
+        """
+            Add a signature to the index.
+        """
+        entry = {"time": now, "signature": signature, "link": link, "also": []}
+        self.entries.append(entry)
+        for key in self.keys(signature):
+            self.buckets[key].append(entry)
+        return entry
+
+# The index, loaded from the cluster file on first use
+index = None
+
+def load_index() -> Index:
+    """
+        Load the index from the cluster file and compact the file.
+    """
+    global index
+    if index is not None:
+        return index
+
+    now = time.time()
+    index = Index(float(os.environ.get("CLUSTER_THRESHOLD", 0.5)),
+        float(os.environ.get("CLUSTER_WINDOW", 86400)))
+    if os.path.exists(cluster_file_name()):
+        with open(cluster_file_name(), "r") as file:
+            for line in file:
+                # Skip the lines damaged e.g. by a kill during a write
+                try:
+                    entry = json.loads(line)
+                    if entry["time"] >= now - index.window:
+                        index.add(entry["signature"], entry["link"],
+                            entry["time"])
+                except (ValueError, KeyError, TypeError):
+                    continue
+
+    # Keep only the entries within the window
+    write_index_to_file(index)
+    return index
+
+def write_index_to_file(index: Index) -> None:
+    """
+        Write all the entries of an index to the cluster file. The file is
+        replaced atomically, so a kill never leaves it truncated.
+    """
+    with open(cluster_file_name() + ".tmp", "w") as file:
+        for entry in index.entries:
+            file.write(entry_line(entry))
+    os.replace(cluster_file_name() + ".tmp", cluster_file_name())
+
+def entry_line(entry: dict) -> str:
+    """
+        Return a line of the cluster file for an entry.
+    """
+    return json.dumps({
+        "time": entry["time"],
+        "link": entry["link"],
+        "signature": entry["signature"],
+    }) + "\n"
+
+def write_entry_to_file(entry: dict) -> None:
+    """
+        Write an entry to the cluster file.
+    """
+    with open(cluster_file_name(), "a") as file:
+        file.write(entry_line(entry))
+
+class ProcessorCluster(Processor):
+    """
+        A class to represent a near-duplicate clustering processor.
+    """
+    def process(self, content: Content, logger: logging.Logger) -> Content|None:
+        """
+            Drop a content similar to a story alerted within the window.
+        """
+        # Outlets reword the same headline, but write their own descriptions
+        signature = minhash(content.title or content.description or "")
+        if signature is None:
+            return content
+
+        index = load_index()
+        if index.expire(time.time()):
+            write_index_to_file(index)
+
+        # Attach the content to the cluster of a similar story
+        entry = index.search(signature)
+        if entry is not None:
+            entry["also"].append(content.link)
+            logger.info(json.dumps({
+                "time": time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime()),
+                "msg": "Near-duplicate dropped",
+                "title": content.title,
+                "link": entry["link"],
+                "also_reported_by": entry["also"],
+            }, ensure_ascii=False))
+            return None
+
+        # Keep the signature until the content is alerted
+        content.signature = signature
+        return content
+
+class ProcessorClusterAdd(Processor):
+    """
+        A class to start a cluster for an alerted content. It runs after the
+        processors deciding whether to alert, so a content dropped by them
+        does not hide its near-duplicates.
+    """
+    def process(self, content: Content, logger: logging.Logger) -> Content|None:
+        """
+            Add the signature of a content to the index.
+        """
+        if content.signature is not None:
+            write_entry_to_file(
+                load_index().add(content.signature, content.link, time.time()))
+        return content
@@ -67,8 +67,8 @@ class ProcessorOpenAI(Processor):
             "link": content.link,
         }, ensure_ascii=False))
 
-        # Set description
-        content.description = parsed["justification"]
+        # Set justification
+        content.justification = parsed["justification"]
         return content
 
 def get_prompt(content: str) -> str:
@@ -10,10 +10,10 @@ def tmp_file_name():
     """
     return os.environ.get("TMPDIR", "/tmp") + "/war-alert.txt"
 
-def search_hash_in_file(hash):
+def search_hash_in_file(*hashes):
     """
-        Search a hash in a temporary file. Create a temporary file if it
-        doesn't exist.
+        Search any of the hashes in a temporary file. Create a temporary file
+        if it doesn't exist.
     """
     # Create a temporary file
     if not os.path.exists(tmp_file_name()):
@@ -22,7 +22,7 @@ def search_hash_in_file(hash):
 
     with open(tmp_file_name(), "r") as file:
         for line in file:
-            if line.startswith(hash):
+            if line.startswith(hashes):
                 return True
     return False
 
@@ -47,9 +47,10 @@ class ProcessorUnique(Processor):
         """
             Process a content.
         """
-        # Check if the content has already been processed
-        hash = calculate_md5_hash(str(content))
-        if search_hash_in_file(hash):
+        # Check if the content has already been processed, also by the hash
+        # of its string representation written by the previous versions
+        hash = content.digest
+        if search_hash_in_file(hash, calculate_md5_hash(str(content))):
             return None
 
         # Write the hash to the temporary file
@@ -0,0 +1,139 @@
+import contextlib
+import cProfile
+import json
+import logging
+import os
+import threading
+import time
+import tracemalloc
+
+def profile_dir() -> str:
+    """
+        Return the directory for the profiling dumps using $PROFILE_DIR or
+        $TMPDIR environment variables.
+    """
+    return os.environ.get("PROFILE_DIR",
+        os.environ.get("TMPDIR", "/tmp") + "/war-alert-profile")
+
+class Tracer:
+    """
+        A class to record the stages of a cycle as Chrome trace events.
+    """
+    def __init__(self):
+        """
+            Initialize a tracer.
+        """
+        self.events = []
+        self.start = time.perf_counter()
+
+    @contextlib.contextmanager
+    def span(self, name: str, **args):
+        """
+            Record the duration of a stage.
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.events.append({
+                "name": name,
+                "cat": "war-alert",
+                "ph": "X",
+                "ts": (start - self.start) * 1e6,
+                "dur": (time.perf_counter() - start) * 1e6,
+                "pid": os.getpid(),
+                "tid": threading.get_ident(),
+                "args": args,
+            })
+
+    def dump(self, path: str) -> None:
+        """
+            Write the events in the Chrome trace JSON format.
+        """
+        with open(path, "w") as file:
+            json.dump({"traceEvents": self.events}, file, ensure_ascii=False)
+
+class Profiler:
+    """
+        A class to profile a window of the next cycles.
+    """
+    def __init__(self):
+        """
+            Initialize a profiler.
+        """
+        self.remaining = 0
+        self.cycle = 0
+        self.profile = None
+        self.tracer = None
+
+    def arm(self, cycles: int) -> None:
+        """
+            Profile the next cycles. Safe to call from a signal handler.
+        """
+        self.remaining = max(self.remaining, cycles)
+
+    @contextlib.contextmanager
+    def window(self, logger: logging.Logger):
+        """
+            Profile a cycle if the window is open.
+        """
+        self.cycle += 1
+        if self.remaining <= 0:
+            yield
+            return
+
+        # Start the profilers
+        self.tracer = Tracer()
+        self.profile = cProfile.Profile()
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+        self.profile.enable()
+        try:
+            yield
+        finally:
+            self.profile.disable()
+            self.remaining -= 1
+            try:
+                self.dump(logger)
+            finally:
+                if self.remaining <= 0:
+                    tracemalloc.stop()
+                self.profile = None
+                self.tracer = None
+
+    def dump(self, logger: logging.Logger) -> None:
+        """
+            Write the profile, the memory snapshot and the trace of a cycle.
+        """
+        prefix = os.path.join(profile_dir(), "cycle-%s-%d" % (
+            time.strftime("%Y%m%dT%H%M%S", time.localtime()), self.cycle))
+
+        try:
+            os.makedirs(profile_dir(), exist_ok=True)
+            self.profile.dump_stats(prefix + ".prof")
+            tracemalloc.take_snapshot().dump(prefix + ".tracemalloc")
+            self.tracer.dump(prefix + ".trace.json")
+        except Exception as e:
+            logger.error(json.dumps({
+                "time": time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime()),
+                "msg": "Error writing profiling dumps",
+                "exception": str(e),
+            }, ensure_ascii=False))
+            return
+
+        logger.info(json.dumps({
+            "time": time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime()),
+            "msg": "Profiling dumps written",
+            "prefix": prefix,
+            "remaining": self.remaining,
+        }, ensure_ascii=False))
+
+profiler = Profiler()
+
+def span(name: str, **args):
+    """
+        Record a stage of the cycle if it is profiled, otherwise do nothing.
+    """
+    if profiler.tracer is None:
+        return contextlib.nullcontext()
+    return profiler.tracer.span(name, **args)
@@ -3,9 +3,9 @@ import os
 import time
 import requests
 import logging
+import components
 from sources.base import Source
 from processors.base import Content, Processor
-from processors.unique import ProcessorUnique
 
 url = "https://api.alerts.in.ua/v1/alerts/active.json"
 
@@ -13,14 +13,7 @@ class Alert(Content):
     """
         A class to represent an alert.
     """
-    def __init__(self, title, description, pubDate, link):
-        """
-            Initialize an alert.
-        """
-        self.title = title
-        self.description = description
-        self.pubDate = pubDate
-        self.link = link
+    __slots__ = ()
 
     def __str__(self):
         """
@@ -32,6 +25,8 @@ class SourceAlertsInUa(Source):
     """
         A class to represent the AlertsInUa source.
     """
+    critical = True
+
     def __init__(self, url: str, logger: logging.Logger):
         """
             Initialize the AlertsInUa source.
@@ -43,9 +38,9 @@ class SourceAlertsInUa(Source):
         """
             Return a list of processors.
         """
-        return [ProcessorUnique]
+        return components.processors("unique")
 
-    def fetch(self, logger) -> list[Alert]:
+    def fetch(self, logger, timeout: float|None = None) -> list[Alert]:
         """
             Return a list of alerts.
         """
@@ -63,8 +58,9 @@ class SourceAlertsInUa(Source):
 
         # Get the alerts
         try:
-            response = requests.get(self.url, headers=headers)
+            response = requests.get(self.url, headers=headers, timeout=timeout)
         except Exception as e:
+            self.error = str(e)
             self.logger.error(json.dumps({
                 "time": time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime()),
                 "url": self.url,
@@ -75,6 +71,7 @@ class SourceAlertsInUa(Source):
 
         # Check the response
         if response.status_code != 200:
+            self.error = f"HTTP {response.status_code}"
             self.logger.error(json.dumps({
                 "time": time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime()),
                 "url": self.url,
@@ -91,6 +88,7 @@ class SourceAlertsInUa(Source):
                 return []
             alerts = alerts["alerts"]
         except Exception as e:
+            self.error = str(e)
             self.logger.error(json.dumps({
                 "time": time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime()),
                 "url": self.url,
@@ -127,6 +125,7 @@ class SourceAlertsInUa(Source):
         title = f"{alert_type} alert in {alert['location_title']}"
         pubDate = alert["started_at"]
         link = f"https://alerts.in.ua"
+        guid = str(alert.get("id", f"{alert['location_title']} {pubDate}"))
 
         # Prepare the description
         if "location_raion" in alert:
@@ -135,4 +134,4 @@ class SourceAlertsInUa(Source):
         else:
             description = f"{alert_type} alert in {alert['location_oblast']}"
 
-        return Alert(title, description, pubDate, link)
+        return Alert(title, description, pubDate, link, guid)
@@ -5,10 +5,20 @@ class Source(ABC):
     """
         A base class for all sources.
     """
+    # The URL identifying the source
+    url = ""
+
+    # A critical source is polled every cycle, whatever its health
+    critical = False
+
+    # The error of the last fetch, None if it succeeded
+    error = None
+
     @abstractmethod
-    def fetch(self, logger) -> list[Content]:
+    def fetch(self, logger, timeout: float|None = None) -> list[Content]:
         """
-            Fetch items from the source.
+            Fetch items from the source. Set the error attribute if the fetch
+            failed.
         """
         return []
 
@@ -4,23 +4,15 @@ import logging
 import requests
 import time
 import xml.etree.ElementTree
+import components
 from sources.base import Source
 from processors.base import Content, Processor
-from processors.unique import ProcessorUnique
-from processors.openai import ProcessorOpenAI
 
 class News(Content):
     """
         A class to represent a news.
     """
-    def __init__(self, title, description, pubDate, link):
-        """
-            Initialize a news.
-        """
-        self.title = title
-        self.description = description
-        self.pubDate = pubDate
-        self.link = link
+    __slots__ = ()
 
     def __str__(self):
         """
@@ -74,9 +66,10 @@ class SourceRSS(Source):
         """
             Return a list of processors.
         """
-        return [ProcessorUnique, ProcessorOpenAI]
+        return components.processors("unique", "cluster", "openai",
+            "cluster_add")
 
-    def fetch(self, logger) -> list[News]:
+    def fetch(self, logger, timeout: float|None = None) -> list[News]:
         """
             Return a list of RSS items from a URL.
         """
@@ -89,8 +82,9 @@ class SourceRSS(Source):
 
         # Get the source of the RSS feed
         try:
-            source = requests.get(self.url).text
+            source = requests.get(self.url, timeout=timeout).text
         except Exception as e:
+            self.error = str(e)
             self.logger.error(json.dumps({
                 "time": time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime()),
                 "url": self.url,
@@ -102,6 +96,7 @@ class SourceRSS(Source):
         try:
             root = xml.etree.ElementTree.fromstring(source)
         except Exception as e:
+            self.error = str(e)
             self.logger.error(json.dumps({
                 "time": time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime()),
                 "url": self.url,
@@ -124,6 +119,7 @@ class SourceRSS(Source):
                 remove_tags(element.find("description").text),
                 element.find("pubDate").text,
                 element.find("link").text,
+                element.findtext("guid"),
             )
         except Exception as e:
             self.logger.error(json.dumps({